@@ -33,6 +33,7 @@ opt.save("opt_task.pkl")
 
 # One can load the optimization task from disk or work directly with the attribute that is saved
 # History keys are saved as lists, where the last dimension stands for their iteration
+# Each `agents` entry is a list of (position, fit) tuples, where positions are numpy arrays
 # opt = Opytimizer.load('opt_task.pkl')
 
 # Prints the last iteration best agent and checks that it matches the best agent in space
@@ -178,8 +178,7 @@ class Agent:
     def clip_by_bound(self) -> None:
         """Clips the agent's decision variables to the bounds limits."""
 
-        for j, (lb, ub) in enumerate(zip(self.lb, self.ub)):
-            self.position[j] = np.clip(self.position[j], lb, ub)
+        self.position[:] = np.clip(self.position, self.lb[:, None], self.ub[:, None])
 
     def fill_with_binary(self) -> None:
         """Fills the agent's decision variables with a binary distribution."""
@@ -14,17 +14,20 @@ logger = logging.get_logger(__name__)
 class Function:
     """A Function class used to hold single-objective functions."""
 
-    def __init__(self, pointer: callable) -> None:
+    def __init__(self, pointer: callable, vectorized: bool = False) -> None:
         """Initialization method.
 
         Args:
             pointer: Pointer to a function that will return the fitness value.
+            vectorized: Whether pointer evaluates a whole array of positions at once,
+                i.e., `(n_agents, n_variables, n_dimensions)` -> `(n_agents,)`.
 
         """
 
         logger.info("Creating class: Function.")
 
         self.pointer = pointer
+        self.vectorized = vectorized
 
         if hasattr(pointer, "__name__"):
             self.name = pointer.__name__
@@ -33,7 +36,12 @@ class Function:
 
         self.built = True
 
-        logger.debug("Function: %s | Built: %s.", self.name, self.built)
+        logger.debug(
+            "Function: %s | Vectorized: %s | Built: %s.",
+            self.name,
+            self.vectorized,
+            self.built,
+        )
         logger.info("Class created.")
 
     def __call__(self, x: np.ndarray) -> float:
@@ -64,6 +72,19 @@ class Function:
 
         self._pointer = pointer
 
+    @property
+    def vectorized(self) -> bool:
+        """Indicates whether the function evaluates a whole array of positions at once."""
+
+        return self._vectorized
+
+    @vectorized.setter
+    def vectorized(self, vectorized: bool) -> None:
+        if not isinstance(vectorized, bool):
+            raise e.TypeError("`vectorized` should be a boolean")
+
+        self._vectorized = vectorized
+
     @property
     def name(self) -> str:
         """Name of the function."""
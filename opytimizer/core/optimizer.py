@@ -5,6 +5,8 @@ import copy
 import time
 from typing import Any, Dict
 
+import numpy as np
+
 import opytimizer.utils.exception as e
 from opytimizer.core.function import Function
 from opytimizer.core.space import Space
@@ -99,6 +101,32 @@ class Optimizer:
 
         pass
 
+    def _evaluate_positions(
+        self, positions: np.ndarray, function: Function
+    ) -> np.ndarray:
+        """Evaluates an array of positions according to the objective function.
+
+        Vectorized functions evaluate the whole array in a single call,
+        while the remaining ones are called once per position.
+
+        Args:
+            positions: Array of positions with shape `(n_agents, n_variables, n_dimensions)`.
+            function: A Function object serving as an objective function.
+
+        Returns:
+            (np.ndarray): Array of fitness values with shape `(n_agents,)`.
+
+        """
+
+        if not getattr(function, "vectorized", False):
+            return np.array([function(position) for position in positions])
+
+        fits = np.asarray(function(positions), dtype=float)
+        if fits.shape != (len(positions),):
+            raise e.SizeError("`function` should return one fitness value per agent")
+
+        return fits
+
     def evaluate(self, space: Space, function: Function) -> None:
         """Evaluates the search space according to the objective function.
 
@@ -114,8 +142,10 @@ class Optimizer:
 
         """
 
-        for agent in space.agents:
-            agent.fit = function(agent.position)
+        fits = self._evaluate_positions(space.positions, function)
+
+        for agent, fit in zip(space.agents, fits):
+            agent.fit = fit
 
             if agent.fit < space.best_agent.fit:
                 space.best_agent.position = copy.deepcopy(agent.position)
@@ -49,6 +49,9 @@ class Space:
         self.mapping = mapping
 
         self.agents = []
+        self._positions = np.zeros((0, n_variables, n_dimensions))
+        self._position_views = []
+
         self.best_agent = Agent(
             n_variables, n_dimensions, lower_bound, upper_bound, mapping
         )
@@ -164,6 +167,30 @@ class Space:
 
         self._agents = agents
 
+    @property
+    def positions(self) -> np.ndarray:
+        """Contiguous array of agents' positions with shape `(n_agents, n_variables, n_dimensions)`.
+
+        Each agent's position is a view over one of its rows, thus writing to this
+        array (or in-place to `agent.position`) updates both of them. If agents have
+        been replaced, re-ordered or had their positions re-assigned, the array is
+        re-gathered from the agents before being returned.
+
+        """
+
+        if not self._has_attached_positions():
+            self._attach_positions()
+
+        return self._positions
+
+    @property
+    def fits(self) -> np.ndarray:
+        """Array of agents' fitness values, aligned with `positions`."""
+
+        return np.fromiter(
+            (agent.fit for agent in self.agents), dtype=float, count=len(self.agents)
+        )
+
     @property
     def best_agent(self) -> Agent:
         """Agent: Best agent."""
@@ -190,6 +217,38 @@ class Space:
 
         self._built = built
 
+    def _has_attached_positions(self) -> bool:
+        """Checks whether every agent's position is still a view over its
+        corresponding row of the positions array.
+
+        Returns:
+            (bool): Whether positions array and agents are synchronized.
+
+        """
+
+        if len(self._position_views) != len(self.agents):
+            return False
+
+        return all(
+            agent.position is view and view.base is self._positions
+            for agent, view in zip(self.agents, self._position_views)
+        )
+
+    def _attach_positions(self) -> None:
+        """Gathers agents' positions into a contiguous array and makes
+        each agent's position a view over its corresponding row.
+
+        """
+
+        if self.agents:
+            self._positions = np.stack([agent.position for agent in self.agents])
+        else:
+            self._positions = np.zeros((0, self.n_variables, self.n_dimensions))
+
+        self._position_views = list(self._positions)
+        for agent, view in zip(self.agents, self._position_views):
+            agent.position = view
+
     def _create_agents(self) -> None:
         """Creates a list of agents."""
 
@@ -198,6 +257,8 @@ class Space:
             for _ in range(self.n_agents)
         ]
 
+        self._attach_positions()
+
     def _initialize_agents(self) -> None:
         """Initializes agents with their positions and defines a best agent.
 
@@ -232,5 +293,7 @@ class Space:
     def clip_by_bound(self) -> None:
         """Clips the agents' decision variables to the bounds limits."""
 
-        for agent in self.agents:
-            agent.clip_by_bound()
+        # Assigns instead of clipping in-place, so non-float positions
+        # (e.g., boolean ones) are casted back to their own type
+        positions = self.positions
+        positions[:] = np.clip(positions, self.lb[:, None], self.ub[:, None])
@@ -20,6 +20,7 @@ class ConstrainedFunction(Function):
         pointer: List[callable],
         constraints: List[callable],
         penalty: float = 0.0,
+        vectorized: bool = False,
     ) -> None:
         """Initialization method.
 
@@ -27,12 +28,14 @@ class ConstrainedFunction(Function):
             pointer: Pointer to a function that will return the fitness value.
             constraints: Constraints to be applied to the fitness function.
             penalty: Penalization factor when a constraint is not valid.
+            vectorized: Whether pointer evaluates a whole array of positions at once,
+                while constraints are still evaluated for each position.
 
         """
 
         logger.info("Overriding class: Function -> ConstrainedFunction.")
 
-        super(ConstrainedFunction, self).__init__(pointer)
+        super(ConstrainedFunction, self).__init__(pointer, vectorized)
 
         self.constraints = constraints or []
         self.penalty = penalty
@@ -79,6 +82,9 @@ class ConstrainedFunction(Function):
 
         """
 
+        if self.vectorized:
+            return self._call_vectorized(x)
+
         fitness = self.pointer(x)
 
         for constraint in self.constraints:
@@ -88,3 +94,22 @@ class ConstrainedFunction(Function):
                 fitness += self.penalty * fitness
 
         return fitness
+
+    def _call_vectorized(self, x: np.ndarray) -> np.ndarray:
+        """Evaluates a whole array of positions, penalizing each one separately.
+
+        Args:
+            x: Array of positions with shape `(n_agents, n_variables, n_dimensions)`.
+
+        Returns:
+            (np.ndarray): Constrained single-objective function fitness of each position.
+
+        """
+
+        fitness = np.array(self.pointer(x), dtype=float)
+
+        for constraint in self.constraints:
+            valid = np.array([bool(constraint(position)) for position in x])
+            fitness[~valid] += self.penalty * fitness[~valid]
+
+        return fitness
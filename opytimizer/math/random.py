@@ -127,3 +127,18 @@ def generate_gaussian_random_number(
     gaussian_array = np.random.normal(mean, variance, size)
 
     return gaussian_array
+
+
+def generate_random_generator() -> np.random.Generator:
+    """Creates a random number generator seeded from NumPy's global random state,
+    so that `np.random.seed` still controls its outputs.
+
+    Returns:
+        (np.random.Generator): A random number generator.
+
+    """
+
+    seed = np.random.randint(0, 2**31 - 1)
+    generator = np.random.default_rng(seed)
+
+    return generator
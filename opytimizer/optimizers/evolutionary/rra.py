@@ -1,7 +1,6 @@
 """Runner-Root Algorithm.
 """
 
-import copy
 from typing import Any, Dict, List, Optional
 
 import numpy as np
@@ -11,7 +10,6 @@ import opytimizer.math.random as r
 import opytimizer.utils.constant as c
 import opytimizer.utils.exception as e
 from opytimizer.core import Optimizer
-from opytimizer.core.agent import Agent
 from opytimizer.core.function import Function
 from opytimizer.core.space import Space
 from opytimizer.utils import logging
@@ -150,39 +148,45 @@ class RRA(Optimizer):
 
     def _stalling_search(
         self,
-        daughters: List[Agent],
+        daughters: np.ndarray,
+        daughters_fit: np.ndarray,
+        lb: np.ndarray,
+        ub: np.ndarray,
         function: Function,
         is_large: bool = True,
     ) -> None:
         """Performs the stalling random larrge or small search (eq. 4 and 5).
 
         Args:
-            daughters: Daughters.
+            daughters: Array of daughters' positions.
+            daughters_fit: Array of daughters' fitness values.
+            lb: Lower bounds.
+            ub: Upper bounds.
             function: A Function object that will be used as the objective function.
             is_large: Whether to perform the large or small search.
 
         """
 
         for _ in range(len(daughters) - 1):
-            temp_daughter = copy.deepcopy(daughters[0])
+            temp_position = daughters[0].copy()
 
-            j = r.generate_integer_random_number(high=temp_daughter.n_variables)
+            j = r.generate_integer_random_number(high=temp_position.shape[0])
 
             if is_large:
                 # Disturbs a selected temporary daughter's position (eq. 4)
                 r1 = r.generate_gaussian_random_number()
-                temp_daughter.position[j] += self.d_runner * r1
+                temp_position[j] += self.d_runner * r1
             else:
                 # Disturbs a selected temporary daughter's position (eq. 5)
                 r1 = r.generate_uniform_random_number(-0.5, 0.5)
-                temp_daughter.position[j] += self.d_root * r1
+                temp_position[j] += self.d_root * r1
 
-            temp_daughter.clip_by_bound()
+            np.clip(temp_position, lb[:, None], ub[:, None], out=temp_position)
 
-            temp_daughter.fit = function(temp_daughter.position)
-            if temp_daughter.fit < daughters[0].fit:
-                daughters[0].position = copy.deepcopy(temp_daughter.position)
-                daughters[0].fit = copy.deepcopy(temp_daughter.fit)
+            temp_fit = function(temp_position)
+            if temp_fit < daughters_fit[0]:
+                daughters[0] = temp_position
+                daughters_fit[0] = temp_fit
 
     def _roulette_selection(self, fitness: List[float], a: float = 0.1) -> int:
         """Performs a roulette selection on the population (eq. 8).
@@ -221,40 +225,50 @@ class RRA(Optimizer):
 
         self.last_best_fit = space.agents[0].fit
 
-        daughters = copy.deepcopy(space.agents)
-        for daughter in daughters[1:]:
-            r1 = r.generate_uniform_random_number(-0.5, 0.5)
+        # Daughters are handled as arrays of positions and fitness values
+        # instead of copies of the whole agents
+        daughters = space.positions.copy()
+        daughters_fit = space.fits
 
-            # Updates the daughter's position and clips its bounds (eq. 2)
-            daughter.position += self.d_runner * r1
-            daughter.clip_by_bound()
+        # Updates the daughters' positions and clips their bounds (eq. 2)
+        r1 = r.generate_uniform_random_number(-0.5, 0.5, (len(daughters) - 1, 1, 1))
+        runners = daughters[1:]
+        runners += self.d_runner * r1
+        np.clip(runners, space.lb[:, None], space.ub[:, None], out=runners)
 
-            daughter.fit = function(daughter.position)
+        daughters_fit[1:] = [function(runner) for runner in runners]
 
-        daughters.sort(key=lambda x: x.fit)
+        order = np.argsort(daughters_fit, kind="stable")
+        daughters, daughters_fit = daughters[order], daughters_fit[order]
 
         # Checks the new positions' effectiviness (eq. 3)
         effectiveness = np.fabs(
-            (self.last_best_fit - daughters[0].fit) / (self.last_best_fit + c.EPSILON)
+            (self.last_best_fit - daughters_fit[0]) / (self.last_best_fit + c.EPSILON)
         )
         if effectiveness < self.tol:
             # Performs the stalling large search (eq. 4)
-            self._stalling_search(daughters, function, is_large=True)
+            self._stalling_search(
+                daughters, daughters_fit, space.lb, space.ub, function, is_large=True
+            )
 
             # Performs the stalling small search (eq. 5)
-            self._stalling_search(daughters, function, is_large=False)
+            self._stalling_search(
+                daughters, daughters_fit, space.lb, space.ub, function, is_large=False
+            )
 
         # Performs the elite selection (eq. 6)
-        space.agents[0] = copy.deepcopy(daughters[0])
+        space.agents[0].position[:] = daughters[0]
+        space.agents[0].fit = daughters_fit[0]
 
-        daughters_fit = [daughter.fit for daughter in daughters]
+        # Selects the remaining agents from the daughters through a roulette
         for agent in space.agents[1:]:
             idx = self._roulette_selection(daughters_fit)
-            agent = copy.deepcopy(daughters[idx])
+            agent.position[:] = daughters[idx]
+            agent.fit = daughters_fit[idx]
 
         # Checks again the positions' effectiviness (eq. 3)
         effectiveness = np.fabs(
-            (self.last_best_fit - daughters[0].fit) / (self.last_best_fit + c.EPSILON)
+            (self.last_best_fit - daughters_fit[0]) / (self.last_best_fit + c.EPSILON)
         )
         if effectiveness < self.tol:
             self.n_stall += 1
@@ -1,14 +1,13 @@
 """Cross-Entropy Method.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
 import numpy as np
 
 import opytimizer.math.random as r
 import opytimizer.utils.exception as e
 from opytimizer.core import Optimizer
-from opytimizer.core.agent import Agent
 from opytimizer.core.function import Function
 from opytimizer.core.space import Space
 from opytimizer.utils import logging
@@ -109,63 +108,36 @@ class CEM(Optimizer):
 
         """
 
-        self.mean = np.zeros(space.n_variables)
-        self.std = np.zeros(space.n_variables)
+        self._rng = r.generate_random_generator()
 
-        for j, (lb, ub) in enumerate(zip(space.lb, space.ub)):
-            self.mean[j] = r.generate_uniform_random_number(lb, ub)
-            self.std[j] = ub - lb
+        self.mean = self._rng.uniform(space.lb, space.ub)
+        self.std = (space.ub - space.lb).astype(float)
 
-    def _create_new_samples(self, agents: List[Agent], function: Function) -> None:
+        self._update_position = np.empty(
+            (min(self.n_updates, space.n_agents), space.n_variables, space.n_dimensions)
+        )
+
+    def _create_new_samples(self, space: Space, function: Function) -> None:
         """Creates new agents based on current mean and standard deviation.
 
         Args:
-            agents (list): List of agents.
+            space: Space containing agents and update-related information.
             function: A Function object that will be used as the objective function.
 
         """
 
-        for agent in agents:
-            for j, (m, s) in enumerate(zip(self.mean, self.std)):
-                agent.position[j] = r.generate_gaussian_random_number(
-                    m, s, agent.n_dimensions
-                )
-
-            agent.clip_by_bound()
-
-            agent.fit = function(agent.position)
-
-    def _update_mean(self, updates: np.ndarray) -> np.ndarray:
-        """Calculates and updates mean.
+        # Draws every agent's sample at once, broadcasting the per-variable
+        # mean and standard deviation across agents and dimensions
+        positions = self._rng.standard_normal(out=space.positions)
+        positions *= self.std[:, None]
+        positions += self.mean[:, None]
 
-        Args:
-            updates: An array of updates' positions.
-
-        Returns:
-            (np.ndarray): The new mean values.
-
-        """
-
-        new_mean = self.alpha * self.mean + (1 - self.alpha) * np.mean(updates)
+        space.clip_by_bound()
 
-        return new_mean
+        fits = self._evaluate_positions(space.positions, function)
 
-    def _update_std(self, updates: np.ndarray) -> np.ndarray:
-        """Calculates and updates standard deviation.
-
-        Args:
-            updates: An array of updates' positions.
-
-        Returns:
-            (np.ndarray): The new standard deviation values.
-
-        """
-
-        new_std = self.alpha * self.std + (1 - self.alpha) * np.sqrt(
-            np.mean((updates - self.mean) ** 2)
-        )
-
-        return new_std
+        for agent, fit in zip(space.agents, fits):
+            agent.fit = fit
 
     def update(self, space: Space, function: Function) -> None:
         """Wraps Cross-Entropy Method over all agents and variables.
@@ -176,13 +148,41 @@ class CEM(Optimizer):
 
         """
 
-        self._create_new_samples(space.agents, function)
+        self._create_new_samples(space, function)
+
+        # Only the best `n_updates` agents are needed, so a partial
+        # partition is enough instead of fully sorting them
+        fits = space.fits
+        n_updates = min(self.n_updates, len(fits))
+        best = np.argpartition(fits, n_updates - 1)[:n_updates]
 
-        space.agents.sort(key=lambda x: x.fit)
+        # Best positions are gathered into a pre-allocated array, which is
+        # only re-allocated if the number of updates has changed
+        shape = (n_updates,) + space.positions.shape[1:]
+        if self._update_position.shape != shape:
+            self._update_position = np.empty(shape)
 
-        update_position = np.array(
-            [agent.position for agent in space.agents[: self.n_updates]]
+        # `mode="clip"` avoids NumPy buffering `out` to check indexes, which
+        # are always valid as they come from `argpartition`
+        update_position = np.take(
+            space.positions, best, axis=0, out=self._update_position, mode="clip"
         )
 
-        self.mean = self._update_mean(update_position)
-        self.std = self._update_std(update_position)
+        # Each variable shares a single mean and standard deviation over its
+        # dimensions, thus the reduction is taken over agents and dimensions
+        update_mean = update_position.mean(axis=(0, 2))
+
+        # Best positions are no longer needed, thus their array is re-used to
+        # hold the deviations, which are squared and summed through `einsum`
+        deviation = update_position
+        deviation -= update_mean[:, None]
+        n_samples = deviation.shape[0] * deviation.shape[2]
+        update_std = np.sqrt(
+            np.einsum("ijk,ijk->j", deviation, deviation) / n_samples
+        )
+
+        self.mean *= self.alpha
+        self.mean += (1 - self.alpha) * update_mean
+
+        self.std *= self.alpha
+        self.std += (1 - self.alpha) * update_std
@@ -1,7 +1,6 @@
 """Electro-Search Algorithm.
 """
 
-import copy
 from typing import Any, Dict, Optional
 
 import numpy as np
@@ -96,20 +95,19 @@ class ESA(Optimizer):
         """
 
         for i, agent in enumerate(space.agents):
-            a = copy.deepcopy(agent)
+            lb, ub = agent.lb[:, None], agent.ub[:, None]
 
-            electrons = [copy.deepcopy(agent) for _ in range(self.n_electrons)]
-            for electron in electrons:
-                r1 = r.generate_uniform_random_number()
-                n = r.generate_integer_random_number(2, 6)
+            # Electrons are handled as an array of positions instead of
+            # copies of the whole agent
+            r1 = r.generate_uniform_random_number(size=(self.n_electrons, 1, 1))
+            n = r.generate_integer_random_number(2, 6, size=(self.n_electrons, 1, 1))
 
-                # Updates the electron's position (eq. 3)
-                electron.position += (2 * r1 - 1) * (1 - 1 / n**2) / self.D[i]
-                electron.clip_by_bound()
+            # Updates the electrons' positions (eq. 3)
+            electrons = agent.position + (2 * r1 - 1) * (1 - 1 / n**2) / self.D[i]
+            np.clip(electrons, lb, ub, out=electrons)
 
-                electron.fit = function(electron.position)
-
-            electrons.sort(key=lambda x: x.fit)
+            electrons_fit = [function(electron) for electron in electrons]
+            best_electron = electrons[np.argmin(electrons_fit)]
 
             # Generates both Rydberg constant and acceleration coefficient
             # Original implementation is missing up an informative description
@@ -117,15 +115,15 @@ class ESA(Optimizer):
             Ac = r.generate_uniform_random_number()
 
             # Updates the Orbital radius (eq. 4)
-            self.D[i] = (electrons[0].position - space.best_agent.position) + Re * (
-                1 / space.best_agent.position**2 - 1 / a.position**2
+            self.D[i] = (best_electron - space.best_agent.position) + Re * (
+                1 / space.best_agent.position**2 - 1 / agent.position**2
             )
 
-            # Updates the temporary agent's position (eq. 5)
-            a.position += Ac * self.D[i]
-            a.clip_by_bound()
+            # Updates the temporary position (eq. 5)
+            position = agent.position + Ac * self.D[i]
+            np.clip(position, lb, ub, out=position)
 
-            a.fit = function(a.position)
-            if a.fit < agent.fit:
-                agent.position = copy.deepcopy(a.position)
-                agent.fit = copy.deepcopy(a.fit)
+            fit = function(position)
+            if fit < agent.fit:
+                agent.position[:] = position
+                agent.fit = fit
@@ -293,5 +293,10 @@ class HGSO(Optimizer):
 
         for agent in space.agents[-N:]:
             # Updates bad agent's position (eq. 12)
+            # A single `r2` is shared by every variable, thus the re-initialized
+            # position is tiled across dimensions to keep the agent's shape
             r2 = r.generate_uniform_random_number()
-            agent.position = agent.lb + r2 * (agent.ub - agent.lb)
+            agent.position = np.tile(
+                agent.lb[:, None] + r2 * (agent.ub - agent.lb)[:, None],
+                (1, agent.n_dimensions),
+            )
@@ -1,7 +1,6 @@
 """Simulated Annealing.
 """
 
-import copy
 from typing import Any, Dict, Optional
 
 import numpy as np
@@ -78,6 +77,64 @@ class SA(Optimizer):
 
         self._beta = beta
 
+    def compile(self, space: Space) -> None:
+        """Compiles additional information that is used by this optimizer.
+
+        Args:
+            space: A Space object containing meta-information.
+
+        """
+
+        self._rng = r.generate_random_generator()
+        self._noise = np.empty((space.n_agents, space.n_variables, space.n_dimensions))
+
+    @staticmethod
+    def _step(
+        positions: np.ndarray,
+        fits: np.ndarray,
+        trial_positions: np.ndarray,
+        trial_fits: np.ndarray,
+        r1: np.ndarray,
+        T: float,
+    ) -> np.ndarray:
+        """Performs the Metropolis acceptance and replaces accepted moves in-place.
+
+        Args:
+            positions: Array of current positions.
+            fits: Array of current fitness values.
+            trial_positions: Array of trial positions.
+            trial_fits: Array of trial fitness values.
+            r1: Array of uniform random numbers.
+            T: System's temperature.
+
+        Returns:
+            (np.ndarray): Boolean mask of accepted moves.
+
+        """
+
+        # Improving moves are always accepted, while worsening moves are
+        # accepted according to the Metropolis criterion, which is only
+        # evaluated for them and thus never overflows
+        delta = trial_fits - fits
+        accept = delta < 0
+
+        # A null temperature only accepts improving moves
+        if T > 0:
+            inv_T = 1 / T
+            uphill = np.flatnonzero(~accept)
+
+            # Probabilities are computed in-place over a single gathered array
+            prob = delta[uphill]
+            prob *= -inv_T
+            np.exp(prob, out=prob)
+
+            accept[uphill] = r1[uphill] < prob
+
+        positions[accept] = trial_positions[accept]
+        fits[accept] = trial_fits[accept]
+
+        return accept
+
     def update(self, space: Space, function: Function) -> None:
         """Wraps Simulated Annealing over all agents and variables.
 
@@ -87,23 +144,24 @@ class SA(Optimizer):
 
         """
 
-        for agent in space.agents:
-            a = copy.deepcopy(agent)
+        positions = space.positions
+        fits = space.fits
+
+        # Trial moves are perturbed and clipped for the whole population at once,
+        # re-using the pre-allocated noise array to hold them
+        trial_positions = self._rng.standard_normal(out=self._noise)
+        trial_positions *= 0.1
+        trial_positions += positions
+        np.clip(
+            trial_positions, space.lb[:, None], space.ub[:, None], out=trial_positions
+        )
 
-            noise = r.generate_gaussian_random_number(
-                0, 0.1, size=((agent.n_variables, agent.n_dimensions))
-            )
+        trial_fits = self._evaluate_positions(trial_positions, function)
 
-            a.position += noise
-            a.clip_by_bound()
+        r1 = self._rng.random(len(fits))
+        accept = self._step(positions, fits, trial_positions, trial_fits, r1, self.T)
 
-            r1 = r.generate_uniform_random_number()
-            a.fit = function(a.position)
-            if a.fit < agent.fit:
-                agent.position = copy.deepcopy(a.position)
-                agent.fit = copy.deepcopy(a.fit)
-            elif r1 < np.exp(-(a.fit - agent.fit) / self.T):
-                agent.position = copy.deepcopy(a.position)
-                agent.fit = copy.deepcopy(a.fit)
+        for i in np.flatnonzero(accept):
+            space.agents[i].fit = fits[i]
 
         self.T *= self.beta
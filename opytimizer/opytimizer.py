@@ -224,7 +224,14 @@ class Opytimizer:
 
         self.evaluate(callbacks)
 
-        with tqdm(total=n_iterations, ascii=True) as b:
+        # Progress bar is refreshed at most every `mininterval` seconds or
+        # `miniters` iterations, thus it does not dominate cheap iterations
+        with tqdm(
+            total=n_iterations,
+            ascii=True,
+            mininterval=0.2,
+            miniters=max(1, n_iterations // 200),
+        ) as b:
             for t in range(n_iterations):
                 logger.to_file(f"Iteration {t+1}/{n_iterations}")
 
@@ -236,7 +243,7 @@ class Opytimizer:
                 self.update(callbacks)
                 self.evaluate(callbacks)
 
-                b.set_postfix(fitness=self.space.best_agent.fit)
+                b.set_postfix(fitness=self.space.best_agent.fit, refresh=False)
                 b.update()
 
                 self.history.dump(
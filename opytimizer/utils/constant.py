@@ -2,33 +2,44 @@
 """
 
 import sys
+from types import MappingProxyType
+
+import numpy as np
 
 # Constant value used to avoid division by zero, zero logarithms
 # and any possible mathematical errors
-EPSILON = 1e-32
+EPSILON: float = 1e-32
+
+# Precision-specific variants of `EPSILON`, which keep the precision of the
+# arrays they are mixed with (float32 uses a larger value as `1e-32` is
+# lost when added to most single-precision numbers)
+EPSILON32 = np.float32(1e-7)
+EPSILON64 = np.float64(EPSILON)
 
 # When the agents are initialized, their fitness are defined as
 # the maximum float possible
-FLOAT_MAX = sys.float_info.max
+FLOAT_MAX: float = sys.float_info.max
 
 # When working with relativity theories, it is necessary
 # to define a constant for the speed of light
 LIGHT_SPEED = 3e5
 
 # When using Genetic Programming, each function node needs an unique number of arguments,
-# which is defined by this dictionary
-FUNCTION_N_ARGS = {
-    "SUM": 2,
-    "SUB": 2,
-    "MUL": 2,
-    "DIV": 2,
-    "EXP": 1,
-    "SQRT": 1,
-    "LOG": 1,
-    "ABS": 1,
-    "SIN": 1,
-    "COS": 1,
-}
+# which is defined by this read-only mapping
+FUNCTION_N_ARGS = MappingProxyType(
+    {
+        "SUM": 2,
+        "SUB": 2,
+        "MUL": 2,
+        "DIV": 2,
+        "EXP": 1,
+        "SQRT": 1,
+        "LOG": 1,
+        "ABS": 1,
+        "SIN": 1,
+        "COS": 1,
+    }
+)
 
 # Test passes if the best solution found by the agent in the target function
 # is smaller than this value
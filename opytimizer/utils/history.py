@@ -52,8 +52,9 @@ class History:
         """
 
         if key == "agents":
-            # Returns a list of tuples (position, fit)
-            return [(v.position.tolist(), v.fit) for v in value]
+            # Returns a list of tuples (position, fit), where positions are copied
+            # as arrays since it is much cheaper than converting them to lists
+            return [(v.position.copy(), v.fit) for v in value]
 
         if key == "best_agent":
             # Returns a tuple (position, fit)
@@ -100,14 +101,17 @@ class History:
 
         """
 
-        attr = np.asarray(getattr(self, key), dtype=list)
-
         if key in ["agents"]:
-            attr_pos = np.hstack(attr[(slice(None), index, 0)])
-            attr_fit = np.hstack(attr[(slice(None), index, 1)])
+            # Positions might be either arrays or lists (previously saved histories)
+            attr = getattr(self, key)
+
+            attr_pos = np.hstack([np.asarray(agents[index][0]) for agents in attr])
+            attr_fit = np.hstack([agents[index][1] for agents in attr])
 
             return attr_pos, attr_fit
 
+        attr = np.asarray(getattr(self, key), dtype=list)
+
         if key in ["best_agent"]:
             attr_pos = np.hstack(attr[(slice(None), 0)])
             attr_fit = np.hstack(attr[(slice(None), 1)])
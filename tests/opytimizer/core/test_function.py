@@ -48,6 +48,23 @@ def test_function_pointer_setter():
     )
 
 
+def test_function_vectorized():
+    new_function = function.Function(pointer)
+
+    assert new_function.vectorized is False
+
+
+def test_function_vectorized_setter():
+    new_function = function.Function(pointer)
+
+    try:
+        new_function.vectorized = "a"
+    except:
+        new_function.vectorized = True
+
+    assert new_function.vectorized is True
+
+
 def test_function_built():
     new_function = function.Function(pointer)
 
@@ -88,3 +88,50 @@ def test_optimizer_evaluate():
     new_optimizer.evaluate(new_search_space, new_function)
 
     assert new_search_space.best_agent.fit < sys.float_info.max
+
+
+def test_optimizer_evaluate_positions():
+    def square(x):
+        return np.sum(x**2)
+
+    def vectorized_square(x):
+        return np.sum(x**2, axis=(1, 2))
+
+    new_optimizer = optimizer.Optimizer()
+
+    positions = np.ones((3, 2, 1))
+
+    fits = new_optimizer._evaluate_positions(positions, function.Function(square))
+
+    assert fits.tolist() == [2, 2, 2]
+
+    # A vectorized function returning a single value should raise an error
+    fits = None
+    try:
+        new_optimizer._evaluate_positions(
+            positions, function.Function(square, vectorized=True)
+        )
+    except:
+        fits = new_optimizer._evaluate_positions(
+            positions, function.Function(vectorized_square, vectorized=True)
+        )
+
+    assert fits.tolist() == [2, 2, 2]
+
+
+def test_optimizer_evaluate_vectorized():
+    def square(x):
+        return np.sum(x**2, axis=(1, 2))
+
+    new_function = function.Function(square, vectorized=True)
+    new_search_space = search.SearchSpace(
+        n_agents=2, n_variables=2, lower_bound=[0, 0], upper_bound=[10, 10]
+    )
+
+    new_optimizer = optimizer.Optimizer()
+    new_optimizer.evaluate(new_search_space, new_function)
+
+    assert new_search_space.agents[0].fit == np.sum(
+        new_search_space.agents[0].position ** 2
+    )
+    assert new_search_space.best_agent.fit < sys.float_info.max
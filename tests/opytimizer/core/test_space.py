@@ -81,6 +81,42 @@ def test_space_agents_setter():
     assert new_space.agents == []
 
 
+def test_space_positions():
+    new_space = space.Space(n_agents=2, n_variables=1, n_dimensions=1)
+
+    assert new_space.positions.shape == (0, 1, 1)
+
+    new_space = space.Space(
+        n_agents=2, n_variables=2, lower_bound=[0, 0], upper_bound=[1, 1]
+    )
+
+    new_space.build()
+
+    assert new_space.positions.shape == (2, 2, 1)
+
+    new_space.positions[1] = 1
+
+    assert new_space.agents[1].position[0] == 1
+
+    new_space.agents.reverse()
+
+    assert new_space.positions[0][0] == 1
+
+    new_space.agents[1].position = np.full((2, 1), 2.0)
+
+    assert new_space.positions[1][0] == 2
+
+
+def test_space_fits():
+    new_space = space.Space(n_agents=2, n_variables=1, n_dimensions=1)
+
+    new_space.build()
+    new_space.agents[0].fit = 1.0
+
+    assert new_space.fits.shape == (2,)
+    assert new_space.fits[0] == 1
+
+
 def test_space_best_agent():
     new_space = space.Space()
 
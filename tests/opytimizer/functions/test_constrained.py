@@ -127,3 +127,24 @@ def test_constrained_call():
 
     assert new_constrained_function(np.zeros(2)) == 0
     assert new_constrained_function(np.ones(2)) == 202
+
+
+def test_constrained_call_vectorized():
+    def square(x):
+        return np.sum(x**2, axis=(1, 2))
+
+    def c_1(x):
+        return x[0] + x[1] <= 0
+
+    new_constrained_function = constrained.ConstrainedFunction(
+        square, [c_1], 100, vectorized=True
+    )
+
+    assert new_constrained_function.vectorized is True
+
+    x = np.stack([np.zeros((2, 1)), np.ones((2, 1))])
+    fits = new_constrained_function(x)
+
+    assert fits.shape == (2,)
+    assert fits[0] == 0
+    assert fits[1] == 202
@@ -43,3 +43,13 @@ def test_generate_gaussian_random_number():
     gaussian_array = random.generate_gaussian_random_number(0, 1, 3)
 
     assert gaussian_array.shape == (3,)
+
+
+def test_generate_random_generator():
+    np.random.seed(0)
+    generator = random.generate_random_generator()
+
+    np.random.seed(0)
+    new_generator = random.generate_random_generator()
+
+    assert generator.random() == new_generator.random()
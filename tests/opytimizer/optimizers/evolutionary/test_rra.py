@@ -2,6 +2,7 @@ import numpy as np
 
 from opytimizer.optimizers.evolutionary import rra
 from opytimizer.spaces import search
+from opytimizer.utils import constant
 
 np.random.seed(0)
 
@@ -118,8 +119,17 @@ def test_rra_stalling_search():
 
     new_rra = rra.RRA()
 
-    new_rra._stalling_search(search_space.agents, square, is_large=True)
-    new_rra._stalling_search(search_space.agents, square, is_large=False)
+    daughters = search_space.positions.copy()
+    daughters_fit = search_space.fits
+
+    new_rra._stalling_search(
+        daughters, daughters_fit, search_space.lb, search_space.ub, square, True
+    )
+    new_rra._stalling_search(
+        daughters, daughters_fit, search_space.lb, search_space.ub, square, False
+    )
+
+    assert daughters_fit[0] < constant.FLOAT_MAX
 
 
 def test_rra_roulette_selection():
@@ -155,3 +165,34 @@ def test_rra_update():
 
     new_rra.tol = 1e-500
     new_rra.update(search_space, square)
+
+
+def test_rra_update_selection():
+    def square(x):
+        return np.sum(x**2)
+
+    search_space = search.SearchSpace(
+        n_agents=10, n_variables=2, lower_bound=[0, 0], upper_bound=[10, 10]
+    )
+
+    for agent in search_space.agents:
+        agent.fit = square(agent.position)
+
+    new_rra = rra.RRA()
+    new_rra.tol = 0
+
+    # Always selects the best daughter, which is also the elite agent
+    new_rra._roulette_selection = lambda fitness, a=0.1: 0
+    new_rra.update(search_space, square)
+
+    best_agent = search_space.agents[0]
+
+    assert best_agent.fit == square(best_agent.position)
+
+    for agent in search_space.agents[1:]:
+        assert np.array_equal(agent.position, best_agent.position)
+        assert agent.fit == best_agent.fit
+
+    search_space.agents[1].position[:] = 0
+
+    assert not np.array_equal(search_space.agents[1].position, best_agent.position)
@@ -80,10 +80,15 @@ def test_cem_create_new_samples():
     new_cem = cem.CEM()
     new_cem.compile(search_space)
 
-    new_cem._create_new_samples(search_space.agents, square)
+    new_cem._create_new_samples(search_space, square)
 
 
-def test_cem_update_mean():
+def test_cem_update():
+    def square(x):
+        return np.sum(x**2)
+
+    new_function = function.Function(pointer=square)
+
     search_space = search.SearchSpace(
         n_agents=10, n_variables=2, lower_bound=[0, 0], upper_bound=[10, 10]
     )
@@ -91,12 +96,18 @@ def test_cem_update_mean():
     new_cem = cem.CEM()
     new_cem.compile(search_space)
 
-    new_cem._update_mean(np.array([1, 1]))
+    new_cem.update(search_space, new_function)
+
+    assert new_cem.mean.shape == (2,)
+    assert new_cem.std.shape == (2,)
 
-    assert new_cem.mean[0] != 0
 
+def test_cem_update_vectorized():
+    def square(x):
+        return np.sum(x**2, axis=(1, 2))
+
+    new_function = function.Function(square, vectorized=True)
 
-def test_cem_update_std():
     search_space = search.SearchSpace(
         n_agents=10, n_variables=2, lower_bound=[0, 0], upper_bound=[10, 10]
     )
@@ -104,22 +115,29 @@ def test_cem_update_std():
     new_cem = cem.CEM()
     new_cem.compile(search_space)
 
-    new_cem._update_std(np.array([1, 1]))
-
-    assert new_cem.std[0] != 0
-
+    new_cem.update(search_space, new_function)
 
-def test_cem_update():
-    def square(x):
-        return np.sum(x**2)
+    assert np.allclose(search_space.fits, square(search_space.positions))
 
-    new_function = function.Function(pointer=square)
 
+def test_cem_update_per_variable():
     search_space = search.SearchSpace(
         n_agents=10, n_variables=2, lower_bound=[0, 0], upper_bound=[10, 10]
     )
 
-    new_cem = cem.CEM()
+    for i, agent in enumerate(search_space.agents):
+        agent.position[:] = [[i], [10 - i]]
+        agent.fit = float(i)
+
+    new_cem = cem.CEM(params={"n_updates": 5, "alpha": 0.7})
     new_cem.compile(search_space)
+    new_cem.mean = np.array([5.0, 5.0])
+    new_cem.std = np.array([1.0, 1.0])
 
-    new_cem.update(search_space, new_function)
+    # Keeps the pre-defined agents instead of sampling new ones
+    new_cem._create_new_samples = lambda space, function: None
+    new_cem.update(search_space, None)
+
+    assert new_cem.mean[0] != new_cem.mean[1]
+    assert np.allclose(new_cem.mean, [0.7 * 5 + 0.3 * 2, 0.7 * 5 + 0.3 * 8])
+    assert np.allclose(new_cem.std, 0.7 * 1 + 0.3 * np.sqrt(2))
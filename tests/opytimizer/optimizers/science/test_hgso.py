@@ -1,5 +1,7 @@
 import numpy as np
 
+from opytimizer import Opytimizer
+from opytimizer.core import function
 from opytimizer.optimizers.science import hgso
 from opytimizer.spaces import search
 
@@ -179,3 +181,17 @@ def test_hgso_update():
     new_hgso.compile(search_space)
 
     new_hgso.update(search_space, square, 1, 10)
+
+
+def test_hgso_start():
+    def square(x):
+        return np.sum(x**2)
+
+    search_space = search.SearchSpace(
+        n_agents=6, n_variables=3, lower_bound=[-10] * 3, upper_bound=[10] * 3
+    )
+
+    opt = Opytimizer(search_space, hgso.HGSO(), function.Function(square))
+    opt.start(n_iterations=10)
+
+    assert search_space.positions.shape == (6, 3, 1)
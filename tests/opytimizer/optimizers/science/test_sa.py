@@ -1,5 +1,6 @@
 import numpy as np
 
+from opytimizer.core import function
 from opytimizer.optimizers.science import sa
 from opytimizer.spaces import search
 
@@ -45,6 +46,31 @@ def test_sa_params_setter():
     assert new_sa.beta == 0.5
 
 
+def test_sa_compile():
+    search_space = search.SearchSpace(
+        n_agents=10, n_variables=2, lower_bound=[0, 0], upper_bound=[10, 10]
+    )
+
+    new_sa = sa.SA()
+    new_sa.compile(search_space)
+
+    assert new_sa._noise.shape == (10, 2, 1)
+
+
+def test_sa_step():
+    positions = np.zeros((2, 1, 1))
+    fits = np.array([1.0, 1.0])
+    trial_positions = np.ones((2, 1, 1))
+    trial_fits = np.array([0.0, 1e10])
+
+    accept = sa.SA._step(positions, fits, trial_positions, trial_fits, np.ones(2), 100)
+
+    assert accept.tolist() == [True, False]
+    assert positions[0][0] == 1
+    assert positions[1][0] == 0
+    assert fits[0] == 0
+
+
 def test_sa_update():
     def square(x):
         return np.sum(x**2)
@@ -55,5 +81,24 @@ def test_sa_update():
         n_agents=10, n_variables=2, lower_bound=[0, 0], upper_bound=[10, 10]
     )
 
+    new_sa.compile(search_space)
     new_sa.update(search_space, square)
     new_sa.update(search_space, square)
+
+
+def test_sa_update_vectorized():
+    def square(x):
+        return np.sum(x**2, axis=(1, 2))
+
+    new_function = function.Function(square, vectorized=True)
+
+    new_sa = sa.SA()
+
+    search_space = search.SearchSpace(
+        n_agents=10, n_variables=2, lower_bound=[0, 0], upper_bound=[10, 10]
+    )
+
+    new_sa.compile(search_space)
+    new_sa.update(search_space, new_function)
+
+    assert np.allclose(search_space.fits, square(search_space.positions))
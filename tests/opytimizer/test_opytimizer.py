@@ -1,7 +1,10 @@
+import numpy as np
+
 import opytimizer
 from opytimizer.core import function
+from opytimizer.optimizers.boolean import bpso
 from opytimizer.optimizers.swarm import pso
-from opytimizer.spaces import search
+from opytimizer.spaces import boolean, search
 from opytimizer.utils import callback, history
 
 
@@ -228,6 +231,21 @@ def test_opytimizer_start():
     new_opytimizer.start(n_iterations=1)
 
 
+def test_opytimizer_start_boolean():
+    def count(x):
+        return np.sum(x)
+
+    space = boolean.BooleanSpace(5, 4)
+    func = function.Function(count)
+    optimizer = bpso.BPSO()
+
+    new_opytimizer = opytimizer.Opytimizer(space, optimizer, func)
+
+    new_opytimizer.start(n_iterations=3)
+
+    assert space.positions.dtype == bool
+
+
 def test_opytimizer_save():
     space = search.SearchSpace(1, 1, 0, 1)
     func = function.Function(callable)
@@ -1,11 +1,17 @@
 import sys
 
+import numpy as np
+
 from opytimizer.utils import constant
 
 
 def test_constant_constants():
     assert constant.EPSILON == 1e-32
 
+    assert constant.EPSILON32.dtype == np.float32
+
+    assert constant.EPSILON64 == constant.EPSILON
+
     assert constant.FLOAT_MAX == sys.float_info.max
 
     assert constant.LIGHT_SPEED == 3e5
@@ -23,4 +29,11 @@ def test_constant_constants():
         "COS": 1,
     }
 
+    try:
+        constant.FUNCTION_N_ARGS["SUM"] = 3
+    except:
+        pass
+
+    assert constant.FUNCTION_N_ARGS["SUM"] == 2
+
     assert constant.TEST_EPSILON == 100
@@ -1,3 +1,5 @@
+import numpy as np
+
 from opytimizer.core import agent
 from opytimizer.utils import history
 
@@ -42,6 +44,47 @@ def test_history_dump():
     assert hasattr(new_history, "agents") is False
 
 
+def test_history_dump_agents():
+    new_history = history.History(save_agents=True)
+
+    agents = [
+        agent.Agent(
+            n_variables=2, n_dimensions=1, lower_bound=[0, 0], upper_bound=[1, 1]
+        )
+        for _ in range(3)
+    ]
+
+    for i, a in enumerate(agents):
+        a.position[:] = [[i], [i + 1]]
+        a.fit = float(i)
+
+    new_history.dump(agents=agents)
+
+    position, fit = new_history.agents[0][1]
+
+    assert isinstance(position, np.ndarray)
+    assert position.tolist() == [[1], [2]]
+    assert fit == 1
+
+    # Dumped arrays should not change along with the agents
+    agents[1].position[:] = 10
+
+    new_history.dump(agents=agents)
+
+    agents_pos, agents_fit = new_history.get_convergence(key="agents", index=1)
+
+    assert agents_pos.tolist() == [[1, 10], [2, 10]]
+    assert agents_fit.tolist() == [1, 1]
+
+    # Previously saved histories hold positions as lists
+    new_history.agents = [[(v.position.tolist(), v.fit) for v in agents]]
+
+    agents_pos, agents_fit = new_history.get_convergence(key="agents", index=1)
+
+    assert agents_pos.tolist() == [[10], [10]]
+    assert agents_fit.tolist() == [1]
+
+
 def test_history_get_convergence():
     new_history = history.History(save_agents=True)
 